@@ -22,10 +22,19 @@ Functions to convert data returned from the Scribe-Data CLI to other file types.
 
 import csv
 import json
+import os
 import shutil
+from itertools import chain, repeat
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Union
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from scribe_data.cli.cli_utils import language_map
 from scribe_data.load.data_to_sqlite import data_to_sqlite
 from scribe_data.utils import (
@@ -36,9 +45,163 @@ from scribe_data.utils import (
     get_language_iso,
 )
 
+# The remove-words and ignore-words entries are membership-tested per token
+# downstream; freezing them into sets once at import makes those checks O(1)
+# instead of a list scan per word.
+for _entry in language_map.values():
+    _entry["remove-words"] = frozenset(_entry.get("remove-words", ()))
+    _entry["ignore-words"] = frozenset(_entry.get("ignore-words", ()))
+
+# Buffer size for file reads and writes. The default (8 KiB) makes large
+# exports syscall-bound; 1 MiB keeps the number of read/write syscalls
+# negligible without a meaningful memory cost per open file.
+_IO_BUFFER_SIZE = 1 << 20
+
+# Batches with at least this many files are converted on a thread pool;
+# below it the pool startup costs more than the overlapped I/O saves.
+_PARALLEL_THRESHOLD = 4
+
+
+@lru_cache(maxsize=512)
+def _resolve_language(language: str) -> dict:
+    """
+    Resolve a language name to its language map entry.
+
+    Batch conversions resolve the same language once per file, so the
+    lookup is memoized on the raw name; unknown languages raise before
+    anything is cached.
+
+    Parameters
+    ----------
+        language : str
+            The language name, in any casing.
+
+    Returns
+    -------
+        dict
+            The language map entry for the language.
+    """
+    normalized_language = language_map.get(language.lower())
+
+    if not normalized_language:
+        raise ValueError(f"Language '{language.capitalize()}' is not recognized.")
+
+    return normalized_language
+
+
+@lru_cache(maxsize=256)
+def _language_iso(language: str) -> str:
+    """
+    Resolve a language name to its ISO code, memoized.
+
+    The underlying resolver may walk an ISO table per call, and batch
+    sqlite conversions ask for the same language once per data type, so
+    the result is cached on the raw name.
+
+    Parameters
+    ----------
+        language : str
+            The language name, in any casing.
+
+    Returns
+    -------
+        str
+            The ISO code for the language.
+    """
+    return get_language_iso(language)
+
+
 # MARK: JSON
 
 
+def _dump_json(data: dict, output_file: Path) -> None:
+    """
+    Write converted data to a JSON output file.
+
+    orjson serializes several times faster than the stdlib encoder and
+    emits UTF-8 bytes directly, so it is used when installed; the stdlib
+    writer stays as the fallback and both produce the same 2-space
+    indented, non-ASCII-preserving output.
+
+    Parameters
+    ----------
+        data : dict
+            The converted data to serialize.
+
+        output_file : Path
+            The output file path to write to.
+
+    Returns
+    -------
+        None
+    """
+    if orjson is not None:
+        with output_file.open("wb", buffering=_IO_BUFFER_SIZE) as file:
+            file.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+    else:
+        with output_file.open(
+            "w", buffering=_IO_BUFFER_SIZE, encoding="utf-8"
+        ) as file:
+            json.dump(data, file, ensure_ascii=False, indent=2)
+
+
+def _stream_json(pairs, output_file: Path) -> None:
+    """
+    Stream (key, value) pairs to a JSON output file one entry at a time.
+
+    Non-aggregating conversions produce one output entry per input row,
+    so the object can be written out as rows are parsed — peak memory
+    stays at a single entry no matter how large the input file is. The
+    entries go into a temporary sibling that only replaces the target
+    once every pair has been written, so a parse error raised while the
+    pairs are consumed leaves any previous export untouched.
+
+    Parameters
+    ----------
+        pairs : iterable
+            The (key, value) pairs to serialize, in output order.
+
+        output_file : Path
+            The output file path to write to.
+
+    Returns
+    -------
+        None
+    """
+    if orjson is not None:
+        dumps = orjson.dumps
+
+    else:
+
+        def dumps(obj):
+            return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    temp_file = output_file.with_name(f"{output_file.name}.tmp")
+
+    try:
+        with temp_file.open("wb", buffering=_IO_BUFFER_SIZE) as file:
+            # The braces are written unconditionally so an empty iterable
+            # still produces a valid (empty) JSON object.
+            file.write(b"{")
+            separator = b"\n  "
+
+            for key, value in pairs:
+                file.write(separator)
+                file.write(dumps(key))
+                file.write(b": ")
+                file.write(dumps(value))
+                separator = b",\n  "
+
+            file.write(b"\n}")
+
+    except Exception:
+        temp_file.unlink(missing_ok=True)
+        raise
+
+    temp_file.replace(output_file)
+
+
 def convert_to_json(
     language: str,
     data_type: Union[str, List[str]],
@@ -74,10 +237,7 @@ def convert_to_json(
     -------
         None
     """
-    normalized_language = language_map.get(language.lower())
-
-    if not normalized_language:
-        raise ValueError(f"Language '{language.capitalize()}' is not recognized.")
+    normalized_language = _resolve_language(language)
 
     data_types = [data_type] if isinstance(data_type, str) else data_type
 
@@ -87,56 +247,104 @@ def convert_to_json(
     json_output_dir = Path(output_dir) / normalized_language["language"].capitalize()
     json_output_dir.mkdir(parents=True, exist_ok=True)
 
-    for dtype in data_types:
-        input_file_path = Path(input_file)
+    # Normalize the input path once; every data type reads the same file.
+    input_file_path = Path(input_file)
 
-        if not input_file_path.exists():
-            raise FileNotFoundError(
-                f"No data found for input file '{input_file_path}'."
-            )
+    delimiter = {".csv": ",", ".tsv": "\t"}.get(input_file_path.suffix.lower())
+
+    if not delimiter:
+        raise ValueError(
+            f"Unsupported file extension '{input_file_path.suffix}' for {input_file}. Please provide a '.csv' or '.tsv' file."
+        )
 
-        delimiter = {".csv": ",", ".tsv": "\t"}.get(input_file_path.suffix.lower())
+    for dtype in data_types:
+        # The output file and the overwrite prompt are resolved before the
+        # input is touched so the streaming branches below can write
+        # entries out while the rows are still being parsed.
+        output_file = json_output_dir / f"{dtype}.{output_type}"
 
-        if not delimiter:
-            raise ValueError(
-                f"Unsupported file extension '{input_file_path.suffix}' for {input_file}. Please provide a '.csv' or '.tsv' file."
+        if output_file.exists() and not overwrite:
+            user_input = input(
+                f"File '{output_file}' already exists. Overwrite? (y/n): "
             )
+            if user_input.lower() != "y":
+                print(f"Skipping {normalized_language['language']} - {dtype}")
+                continue
 
         try:
-            with input_file_path.open("r", encoding="utf-8") as file:
-                reader = csv.DictReader(file, delimiter=delimiter)
-                rows = list(reader)
-
-                if not rows:
+            with input_file_path.open(
+                "r", buffering=_IO_BUFFER_SIZE, encoding="utf-8"
+            ) as file:
+                # csv.reader skips the dict-per-row allocation and key
+                # re-hashing that csv.DictReader pays for every record.
+                reader = csv.reader(file, delimiter=delimiter)
+                header = next(reader, None)
+                first_row = next(reader, None)
+
+                # csv.DictReader skipped blank lines; csv.reader surfaces
+                # them as empty rows, so they are filtered to keep parity.
+                while first_row is not None and not first_row:
+                    first_row = next(reader, None)
+
+                if first_row is None:
                     print(f"No data found in '{input_file_path}'.")
                     continue
 
-                # Use the first row to inspect column headers
-                first_row = rows[0]
-                keys = list(first_row.keys())
-                data = {}
+                rows = (row for row in chain([first_row], reader) if row)
+                is_emoji_data = len(header) > 2 and all(
+                    col in header for col in ["emoji", "is_base", "rank"]
+                )
+
+                if len(header) == 2:
+                    # Handle Case: { key: value } — one output entry per
+                    # row, streamed without materializing the mapping.
+                    # Short rows pad to None, as csv.DictReader did.
+                    _stream_json(
+                        (
+                            (row[0], row[1] if len(row) > 1 else None)
+                            for row in rows
+                        ),
+                        output_file,
+                    )
+
+                elif len(header) > 2 and not is_emoji_data:
+                    # Handle Case: { key: { value1: ..., value2: ... } } —
+                    # also one entry per row, so it streams as well; the
+                    # None padding fills missing trailing columns the way
+                    # csv.DictReader's restval did.
+                    _stream_json(
+                        (
+                            (
+                                row[0],
+                                dict(
+                                    zip(header[1:], chain(row[1:], repeat(None)))
+                                ),
+                            )
+                            for row in rows
+                        ),
+                        output_file,
+                    )
 
-                if len(keys) == 1:
-                    # Handle Case: { key: None }
-                    data[first_row[keys[0]]] = None
+                else:
+                    # The remaining cases aggregate across rows, so the
+                    # full mapping is built before serializing.
+                    data = {}
 
-                elif len(keys) == 2:
-                    # Handle Case: { key: value }
-                    for row in rows:
-                        key = row[keys[0]]
-                        value = row[keys[1]]
-                        data[key] = value
+                    if len(header) == 1:
+                        # Handle Case: { key: None }
+                        data[first_row[0]] = None
 
-                elif len(keys) > 2:
-                    if all(col in first_row for col in ["emoji", "is_base", "rank"]):
+                    else:
                         # Handle Case: { key: [ { emoji: ..., is_base: ..., rank: ... }, { emoji: ..., is_base: ..., rank: ... } ] }
+                        emoji_idx = header.index("emoji")
+                        is_base_idx = header.index("is_base")
+                        rank_idx = header.index("rank")
+
                         for row in rows:
-                            key = row.get(reader.fieldnames[0])
-                            emoji = row.get("emoji", "").strip()
-                            is_base = (
-                                row.get("is_base", "false").strip().lower() == "true"
-                            )
-                            rank = row.get("rank", None)
+                            key = row[0]
+                            emoji = row[emoji_idx].strip()
+                            is_base = row[is_base_idx].strip().lower() == "true"
+                            rank = row[rank_idx]
                             rank = int(rank) if rank and rank.isdigit() else None
 
                             entry = {"emoji": emoji, "is_base": is_base, "rank": rank}
@@ -145,38 +353,87 @@ def convert_to_json(
                                 data[key] = []
                             data[key].append(entry)
 
-                    else:
-                        # Handle Case: { key: { value1: ..., value2: ... } }
-                        for row in rows:
-                            data[row[keys[0]]] = {k: row[k] for k in keys[1:]}
+                    _dump_json(data, output_file)
+
+        except FileNotFoundError as e:
+            # The open() above signals a missing file on its own, so no
+            # exists() pre-check (and its extra stat syscall) is needed.
+            raise FileNotFoundError(
+                f"No data found for input file '{input_file_path}'."
+            ) from e
 
         except (IOError, csv.Error) as e:
-            print(f"Error reading '{input_file_path}': {e}")
+            print(f"Error converting '{input_file_path}': {e}")
             continue
 
-        # Define output file path
-        output_file = json_output_dir / f"{dtype}.{output_type}"
+        print(
+            f"Data for {normalized_language['language'].capitalize()} {dtype} written to {output_file}"
+        )
 
-        if output_file.exists() and not overwrite:
-            user_input = input(
-                f"File '{output_file}' already exists. Overwrite? (y/n): "
-            )
-            if user_input.lower() != "y":
-                print(f"Skipping {normalized_language['language']} - {dtype}")
-                continue
 
-        try:
-            with output_file.open("w", encoding="utf-8") as file:
-                json.dump(data, file, ensure_ascii=False, indent=2)
+# MARK: JSON Batch
 
-        except IOError as e:
-            print(f"Error writing to '{output_file}': {e}")
-            continue
 
-        print(
-            f"Data for {normalized_language['language'].capitalize()} {dtype} written to {output_file}"
+def convert_to_json_batch(
+    inputs: List[tuple],
+    output_dir: str = None,
+    overwrite: bool = False,
+) -> None:
+    """
+    Convert multiple CSV/TSV files to JSON in one run.
+
+    The fixed per-call work — resolving languages through the language
+    map — is paid once per distinct language up front rather than once
+    per file, and an unknown language fails the batch before any file is
+    touched. Large overwrite batches run on a thread pool: the per-file
+    work is I/O-bound and the interpreter lock is released during reads
+    and writes, so conversions overlap. Without overwrite the per-file
+    prompt needs stdin, which worker threads would interleave, so those
+    batches stay serial.
+
+    Parameters
+    ----------
+        inputs : List[tuple]
+            The (language, data_type, input_file) triples to convert.
+
+        output_dir : Path
+            The output directory path for results.
+
+        overwrite : bool
+            Whether to overwrite existing files.
+
+    Returns
+    -------
+        None
+    """
+    # Warm the memoized lookup so the per-file conversions below hit the
+    # cache instead of the language map.
+    for language, _, _ in inputs:
+        _resolve_language(language)
+
+    def _convert_one(entry) -> None:
+        language, data_type, input_file = entry
+        convert_to_json(
+            language,
+            data_type,
+            "json",
+            input_file,
+            output_dir=output_dir,
+            overwrite=overwrite,
         )
 
+    # Only unattended runs fan out: with overwrite off, convert_to_json
+    # prompts on stdin per existing file, and concurrent input() calls
+    # from workers would attribute answers to the wrong file.
+    if overwrite and len(inputs) >= _PARALLEL_THRESHOLD:
+        max_workers = min(32, (os.cpu_count() or 1) + 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(_convert_one, inputs))
+
+    else:
+        for entry in inputs:
+            _convert_one(entry)
+
 
 #
 # MARK: CSV or TSV
@@ -195,43 +452,41 @@ def convert_to_csv_or_tsv(
     """
 
     # Normalize the language
-    normalized_language = language_map.get(language.lower())
-
-    if not normalized_language:
-        raise ValueError(f"Language '{language.capitalize()}' is not recognized.")
+    normalized_language = _resolve_language(language)
 
     # Split the data_type string by commas
     data_types = [dtype.strip() for dtype in data_type.split(",")]
 
+    # Normalize the input path and resolve the output directory once; they
+    # are the same for every data type.
+    input_file = Path(input_file)
+
+    # Determine the delimiter based on output type
+    delimiter = "," if output_type == "csv" else "\t"
+
+    if output_dir is None:
+        output_dir = (
+            DEFAULT_CSV_EXPORT_DIR if output_type == "csv" else DEFAULT_TSV_EXPORT_DIR
+        )
+
+    final_output_dir = Path(output_dir) / normalized_language["language"].capitalize()
+    final_output_dir.mkdir(parents=True, exist_ok=True)
+
     for dtype in data_types:
-        input_file = Path(input_file)
         if not input_file.exists():
             print(f"No data found for {dtype} conversion at '{input_file}'.")
             continue
 
         try:
-            with input_file.open("r", encoding="utf-8") as f:
+            with input_file.open(
+                "r", buffering=_IO_BUFFER_SIZE, encoding="utf-8"
+            ) as f:
                 data = json.load(f)
 
         except (IOError, json.JSONDecodeError) as e:
             print(f"Error reading '{input_file}': {e}")
             continue
 
-        # Determine the delimiter based on output type
-        delimiter = "," if output_type == "csv" else "\t"
-
-        if output_dir is None:
-            output_dir = (
-                DEFAULT_CSV_EXPORT_DIR
-                if output_type == "csv"
-                else DEFAULT_TSV_EXPORT_DIR
-            )
-
-        final_output_dir = (
-            Path(output_dir) / normalized_language["language"].capitalize()
-        )
-        final_output_dir.mkdir(parents=True, exist_ok=True)
-
         output_file = final_output_dir / f"{dtype}.{output_type}"
         if output_file.exists() and not overwrite:
             user_input = input(
@@ -242,7 +497,9 @@ def convert_to_csv_or_tsv(
                 continue
 
         try:
-            with output_file.open("w", newline="", encoding="utf-8") as file:
+            with output_file.open(
+                "w", buffering=_IO_BUFFER_SIZE, newline="", encoding="utf-8"
+            ) as file:
                 writer = csv.writer(file, delimiter=delimiter)
                 # Handle different JSON structures based on the format
 
@@ -314,6 +571,41 @@ def convert_to_csv_or_tsv(
 # MARK: SQLITE
 
 
+def _fast_copy(source_path, target_path) -> None:
+    """
+    Copy a file, never aliasing the target to the source.
+
+    shutil.copy already delegates to an in-kernel os.sendfile copy on
+    this platform, so no manual fast path is needed. A hardlink would be
+    cheaper still but is deliberately not used: SQLite rebuilds its
+    database in place, which would silently rewrite a linked "copy". A
+    target that already aliases the source — left behind by an earlier
+    revision of this helper — is unlinked first, since writing through
+    the shared inode would truncate the source as well.
+
+    Parameters
+    ----------
+        source_path : Path
+            The file to copy.
+
+        target_path : Path
+            The destination path.
+
+    Returns
+    -------
+        None
+    """
+    try:
+        if os.path.samefile(source_path, target_path):
+            os.unlink(target_path)
+
+    except OSError:
+        # A missing target is fine; the copy below creates it.
+        pass
+
+    shutil.copy(source_path, target_path)
+
+
 def convert_to_sqlite(
     language: str,
     data_type: str,
@@ -368,21 +660,27 @@ def convert_to_sqlite(
     if not output_dir.exists():
         output_dir.mkdir(parents=True, exist_ok=True)
 
+    source_file = f"{_language_iso(language).upper()}LanguageData.sqlite"
+    # os.path.join on plain strings skips the flavour dispatch and
+    # normalization that each Path.__truediv__ pays; the results are
+    # wrapped back into Path once for the exists()/copy calls below.
+    source_path = Path(os.path.join(os.fspath(input_file.parent), source_file))
+    target_path = Path(os.path.join(os.fspath(output_dir), source_file))
+
+    # Re-running an already converted dataset should be a no-op: bail out
+    # before the expensive data_to_sqlite call rather than after it.
+    if target_path.exists() and not overwrite:
+        print(f"File {target_path} already exists. Use --overwrite to replace.")
+        return
+
     print(
         f"Converting data for language: {language}, data type: {data_type} to {output_type}"
     )
     data_to_sqlite(languages, specific_tables)
 
-    source_file = f"{get_language_iso(language).upper()}LanguageData.sqlite"
-    source_path = input_file.parent / source_file
-    target_path = output_dir / source_file
-
     if source_path.exists():
-        if target_path.exists() and not overwrite:
-            print(f"File {target_path} already exists. Use --overwrite to replace.")
-        else:
-            shutil.copy(source_path, target_path)
-            print(f"SQLite database copied to: {target_path}")
+        _fast_copy(source_path, target_path)
+        print(f"SQLite database copied to: {target_path}")
     else:
         print(f"Warning: SQLite file not found at {source_path}")
 
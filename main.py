@@ -27,6 +27,7 @@ from pathlib import Path
 from scribe_data.cli.convert import (
     convert_to_csv_or_tsv,
     convert_to_json,
+    convert_to_json_batch,
     convert_to_sqlite,
 )
 from scribe_data.cli.get import get_data
@@ -227,6 +228,12 @@ def main() -> None:
         action="store_true",
         help="Whether to overwrite existing files (default: False).",
     )
+    convert_parser.add_argument(
+        "-b",
+        "--batch",
+        action="store_true",
+        help="Treat the input file as a manifest of 'language,data-type,input-file' rows to convert to JSON in one run.",
+    )
     convert_parser.add_argument(
         "-ko",
         "--keep-original",
@@ -292,14 +299,37 @@ def main() -> None:
             )
 
         elif args.output_type == "json":
-            convert_to_json(
-                language=args.language,
-                data_type=args.data_type,
-                output_type=args.output_type,
-                input_file=args.input_file,
-                output_dir=args.output_dir,
-                overwrite=args.overwrite,
-            )
+            if args.batch:
+                inputs = []
+                with open(args.input_file, "r", encoding="utf-8") as manifest:
+                    for line_number, line in enumerate(manifest, start=1):
+                        line = line.strip()
+                        if not line:
+                            continue
+
+                        fields = line.split(",", 2)
+                        if len(fields) != 3:
+                            raise ValueError(
+                                f"Line {line_number} of '{args.input_file}' is not a 'language,data-type,input-file' row: '{line}'"
+                            )
+
+                        inputs.append(tuple(fields))
+
+                convert_to_json_batch(
+                    inputs,
+                    output_dir=args.output_dir,
+                    overwrite=args.overwrite,
+                )
+
+            else:
+                convert_to_json(
+                    language=args.language,
+                    data_type=args.data_type,
+                    output_type=args.output_type,
+                    input_file=args.input_file,
+                    output_dir=args.output_dir,
+                    overwrite=args.overwrite,
+                )
 
     else:
         parser.print_help()